@@ -86,6 +86,20 @@ class APIVersionManager(object):
         self._active = None
 
 
+class APIResourceWrapperMetaclass(type):
+    """Builds a frozenset of each wrapper class's ``_attrs``.
+
+    ``_attrs`` keeps its declared order, which is used for serialization,
+    while ``__getattr__`` checks membership against the frozenset.
+    """
+    def __new__(mcs, name, bases, attrs):
+        cls = super(APIResourceWrapperMetaclass, mcs).__new__(mcs, name,
+                                                              bases, attrs)
+        cls._attrs_set = frozenset(cls._attrs)
+        return cls
+
+
+@six.add_metaclass(APIResourceWrapperMetaclass)
 class APIResourceWrapper(object):
     """Simple wrapper for api objects.
 
@@ -98,14 +112,13 @@ class APIResourceWrapper(object):
     def __init__(self, apiresource):
         self._apiresource = apiresource
 
-    def __getattribute__(self, attr):
-        try:
-            return object.__getattribute__(self, attr)
-        except AttributeError:
-            if attr not in self._attrs:
-                raise
-            # __getattr__ won't find properties
-            return getattr(self._apiresource, attr)
+    def __getattr__(self, attr):
+        # Only called when the normal lookup failed, so attributes and
+        # properties of the wrapper itself are resolved without going
+        # through Python code on every access.
+        if attr not in self._attrs_set:
+            raise AttributeError(attr)
+        return getattr(self._apiresource, attr)
 
     def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__,
@@ -114,10 +127,8 @@ class APIResourceWrapper(object):
                                   if hasattr(self, attr)))
 
     def to_dict(self):
-        obj = {}
-        for key in self._attrs:
-            obj[key] = getattr(self._apiresource, key, None)
-        return obj
+        return {key: getattr(self._apiresource, key, None)
+                for key in self._attrs}
 
 
 class APIDictWrapper(object):
@@ -136,13 +147,10 @@ class APIDictWrapper(object):
     def __init__(self, apidict):
         self._apidict = apidict
 
-    def __getattribute__(self, attr):
-        try:
-            return object.__getattribute__(self, attr)
-        except AttributeError:
-            if attr not in self._apidict:
-                raise
-            return self._apidict[attr]
+    def __getattr__(self, attr):
+        if attr not in self._apidict:
+            raise AttributeError(attr)
+        return self._apidict[attr]
 
     def __getitem__(self, item):
         try:
@@ -303,12 +311,24 @@ def url_for(request, service_type, endpoint_type=None, region=None):
                                              'OPENSTACK_ENDPOINT_TYPE',
                                              'publicURL')
     fallback_endpoint_type = getattr(settings, 'SECONDARY_ENDPOINT_TYPE', None)
-
+    if not region:
+        region = request.user.services_region
+    # Every API client is built from the service catalog, often several
+    # times per request, so the URLs are kept on the request instead of
+    # rescanning the catalog each time.
+    cache = request.__dict__.setdefault('_url_for_cache', {})
+    key = (service_type, endpoint_type, fallback_endpoint_type, region)
+    if key not in cache:
+        cache[key] = _url_for(request, service_type, endpoint_type,
+                              fallback_endpoint_type, region)
+    return cache[key]
+
+
+def _url_for(request, service_type, endpoint_type, fallback_endpoint_type,
+             region):
     catalog = request.user.service_catalog
     service = get_service_from_catalog(catalog, service_type)
     if service:
-        if not region:
-            region = request.user.services_region
         url = get_url_for_service(service,
                                   region,
                                   endpoint_type)
@@ -472,8 +472,7 @@ class CeilometerUsage(object):
         users = keystone.user_list(self._request)
         # Cache all users on right indexes, this is more effective than to
         # obtain large number of users one by one by keystone.user_get
-        for u in users:
-            self._users[u.id] = u
+        self._users.update((u.id, u) for u in users)
 
     def get_tenant(self, tenant_id):
         """Returns tenant fetched from API.
@@ -499,8 +498,7 @@ class CeilometerUsage(object):
         tenants, more = keystone.tenant_list(self._request)
         # Cache all tenants on right indexes, this is more effective than to
         # obtain large number of tenants one by one by keystone.tenant_get
-        for t in tenants:
-            self._tenants[t.id] = t
+        self._tenants.update((t.id, t) for t in tenants)
 
     def global_data_get(self, used_cls=None, query=None,
                         with_statistics=False, additional_query=None,
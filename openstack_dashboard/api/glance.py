@@ -67,18 +67,19 @@ class Image(base.APIResourceWrapper):
     def __init__(self, apiresource):
         super(Image, self).__init__(apiresource)
 
-    def __getattribute__(self, attr):
+    def __getattr__(self, attr):
         # Because Glance v2 treats custom properties as normal
         # attributes, we need to be more flexible than the resource
         # wrappers usually allow. In v1 they were defined under a
         # "properties" attribute.
         if VERSIONS.active >= 2 and attr == "properties":
-            return {k: v for (k, v) in self._apiresource.items()
-                    if self.property_visible(k)}
-        try:
-            return object.__getattribute__(self, attr)
-        except AttributeError:
-            return getattr(self._apiresource, attr)
+            properties = {k: v for (k, v) in self._apiresource.items()
+                          if self.property_visible(k)}
+            # Store the result on the instance so that further lookups
+            # are plain attribute reads which never reach __getattr__.
+            self.__dict__['properties'] = properties
+            return properties
+        return getattr(self._apiresource, attr)
 
     @property
     def name(self):
@@ -319,10 +320,7 @@ def image_list_detailed(request, marker=None, sort_dir='desc',
     else:
         images = list(images_iter)
 
-    # TODO(jpichon): Do it better
-    wrapped_images = []
-    for image in images:
-        wrapped_images.append(Image(image))
+    wrapped_images = [Image(image) for image in images]
 
     return wrapped_images, has_more_data, has_prev_data
 
@@ -412,9 +410,10 @@ def image_create(request, **kwargs):
     if VERSIONS.active >= 2:
         location = kwargs.pop('location', None)
 
-    image = glanceclient(request).images.create(**kwargs)
+    client = glanceclient(request)
+    image = client.images.create(**kwargs)
     if location is not None:
-        glanceclient(request).images.add_location(image.id, location, {})
+        client.images.add_location(image.id, location, {})
 
     if data:
         if isinstance(data, six.string_types):
@@ -436,7 +435,7 @@ def image_create(request, **kwargs):
                                     {'data': data})
         else:
             def upload():
-                return glanceclient(request).images.upload(image.id, data)
+                return client.images.upload(image.id, data)
             thread.start_new_thread(upload, ())
 
     return Image(image)
@@ -10,23 +10,62 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import contextlib
-import six
-from six.moves.urllib import request
+import base64
+import ssl
 
 from django.conf import settings
+from django.utils.translation import ugettext_lazy as _
 from oslo_serialization import jsonutils
+import requests
+from requests import adapters
+import six
+from six.moves import http_cookiejar
 
 from heatclient import client as heat_client
 from heatclient.common import template_format
 from heatclient.common import template_utils
-from heatclient.common import utils as heat_utils
+from heatclient import exc as heat_exceptions
 from horizon import exceptions
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
 
 
+# Templates and the files they reference via get_file are usually served
+# from a handful of hosts, so they are fetched through a single shared
+# session whose keep-alive connections are reused between requests. The
+# pool should hold at least as many connections per host as there are
+# threads serving requests in the process, otherwise concurrent fetches
+# fall back to opening new connections.
+TEMPLATE_POOL_SIZE = getattr(settings, 'OPENSTACK_HEAT_STACK', {}).get(
+    'template_pool_size', 64)
+TEMPLATE_SESSION = requests.Session()
+# The session is shared by every user of the process, so it must not keep
+# cookies set by a template host and send them on other users' fetches.
+TEMPLATE_SESSION.cookies.set_policy(
+    http_cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_TEMPLATE_ADAPTER = adapters.HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=TEMPLATE_POOL_SIZE,
+    max_retries=adapters.Retry(total=2, backoff_factor=0.1))
+TEMPLATE_SESSION.mount('http://', _TEMPLATE_ADAPTER)
+TEMPLATE_SESSION.mount('https://', _TEMPLATE_ADAPTER)
+# requests would verify template hosts against its bundled CA certificates,
+# so the same settings as the OpenStack clients apply, falling back to the
+# CA certificates of the system.
+if getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False):
+    TEMPLATE_SESSION.verify = False
+else:
+    _verify_paths = ssl.get_default_verify_paths()
+    TEMPLATE_SESSION.verify = (getattr(settings, 'OPENSTACK_SSL_CACERT', None)
+                               or _verify_paths.cafile
+                               or _verify_paths.capath
+                               or True)
+# Seconds to wait for a template host to connect or to send data, so that a
+# host that stops responding does not hold the worker serving the request.
+TEMPLATE_FETCH_TIMEOUT = 10
+
+
 def format_parameters(params):
     parameters = {}
     for count, p in enumerate(params, 1):
@@ -102,12 +141,28 @@ def _ignore_if(key, value):
     return False
 
 
+def _read_url_content(url):
+    try:
+        response = TEMPLATE_SESSION.get(url, timeout=TEMPLATE_FETCH_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException:
+        raise heat_exceptions.CommandError(
+            _('Could not fetch contents for %s') % url)
+
+    content = response.content
+    if content:
+        try:
+            content.decode('utf-8')
+        except ValueError:
+            content = base64.b64encode(content)
+    return content
+
+
 def get_template_files(template_data=None, template_url=None):
     if template_data:
         tpl = template_data
     elif template_url:
-        with contextlib.closing(request.urlopen(template_url)) as u:
-            tpl = u.read()
+        tpl = _read_url_content(template_url)
     else:
         return {}, None
     if not tpl:
@@ -131,7 +186,7 @@ def _get_file_contents(from_data, files):
             if not value.startswith(('http://', 'https://')):
                 raise exceptions.GetFileError(value, 'get_file')
             if value not in files:
-                file_content = heat_utils.read_url_content(value)
+                file_content = _read_url_content(value)
                 if template_utils.is_template(file_content):
                     template = get_template_files(template_url=value)[1]
                     file_content = jsonutils.dumps(template)
@@ -19,8 +19,12 @@
 
 import collections
 import logging
+import threading
+import time
 
 from django.conf import settings
+from django.contrib.auth import signals as auth_signals
+from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 import six
 import six.moves.urllib.parse as urlparse
@@ -42,6 +46,13 @@ LOG = logging.getLogger(__name__)
 DEFAULT_ROLE = None
 DEFAULT_DOMAIN = getattr(settings, 'OPENSTACK_KEYSTONE_DEFAULT_DOMAIN',
                          'default')
+TOKEN_CACHE_TTL = getattr(settings, 'TOKEN_CACHE_TTL', 300)
+TOKEN_CACHE_MAXSIZE = 4096
+
+# Names of the domains looked up on behalf of a token, keyed by
+# (token id, domain id) and mapped to (domain name, expiry timestamp).
+_DOMAIN_NAME_CACHE = {}
+_DOMAIN_NAME_CACHE_LOCK = threading.Lock()
 
 
 # Set up our data structure for managing Identity API versions, and
@@ -177,7 +188,7 @@ def keystoneclient(request, admin=False):
         endpoint = _get_endpoint_url(request, endpoint_type)
         insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
         cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
-        LOG.debug("Creating a new keystoneclient connection to %s." % endpoint)
+        LOG.debug("Creating a new keystoneclient connection to %s.", endpoint)
         remote_addr = request.environ.get('REMOTE_ADDR', '')
         conn = api_version['client'].Client(token=token_id,
                                             endpoint=endpoint,
@@ -204,7 +215,9 @@ def domain_get(request, domain_id):
 
 def domain_delete(request, domain_id):
     manager = keystoneclient(request, admin=True).domains
-    return manager.delete(domain_id)
+    response = manager.delete(domain_id)
+    invalidate_domain(domain_id)
+    return response
 
 
 def domain_list(request):
@@ -235,6 +248,7 @@ def domain_update(request, domain_id, name=None, description=None,
     except Exception:
         LOG.exception("Unable to update Domain: %s" % domain_id)
         raise
+    invalidate_domain(domain_id)
     return response
 
 
@@ -252,6 +266,66 @@ def tenant_create(request, name, description=None, enabled=None,
         raise exceptions.Conflict()
 
 
+def _get_domain_name(request, domain_id, default=None):
+    """Returns the name of a domain, cached per token for TOKEN_CACHE_TTL.
+
+    Most identity views resolve the logged in user's domain, so caching the
+    name saves a Keystone round trip on every one of them. If the domain
+    cannot be retrieved, which is the case for users who may not read their
+    own domain, ``default`` is returned and cached in the same way.
+    """
+    key = (request.user.token.id, domain_id)
+    now = time.time()
+    cached = _DOMAIN_NAME_CACHE.get(key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    try:
+        domain_name = domain_get(request, domain_id).name
+    except Exception:
+        LOG.warning("Unable to retrieve Domain: %s" % domain_id)
+        domain_name = default
+    with _DOMAIN_NAME_CACHE_LOCK:
+        if len(_DOMAIN_NAME_CACHE) >= TOKEN_CACHE_MAXSIZE:
+            for stale_key, (name, expires) in list(
+                    _DOMAIN_NAME_CACHE.items()):
+                if expires <= now:
+                    del _DOMAIN_NAME_CACHE[stale_key]
+            if len(_DOMAIN_NAME_CACHE) >= TOKEN_CACHE_MAXSIZE:
+                _DOMAIN_NAME_CACHE.clear()
+        _DOMAIN_NAME_CACHE[key] = (domain_name, now + TOKEN_CACHE_TTL)
+    return domain_name
+
+
+def invalidate_token(token_id=None):
+    """Drops the cached Keystone lookups made with the given token.
+
+    If no token id is given the whole cache is cleared.
+    """
+    with _DOMAIN_NAME_CACHE_LOCK:
+        if token_id is None:
+            _DOMAIN_NAME_CACHE.clear()
+            return
+        for key in list(_DOMAIN_NAME_CACHE):
+            if key[0] == token_id:
+                del _DOMAIN_NAME_CACHE[key]
+
+
+def invalidate_domain(domain_id):
+    """Drops the cached name of the given domain for every token."""
+    with _DOMAIN_NAME_CACHE_LOCK:
+        for key in list(_DOMAIN_NAME_CACHE):
+            if key[1] == domain_id:
+                del _DOMAIN_NAME_CACHE[key]
+
+
+@receiver(auth_signals.user_logged_out)
+def _invalidate_token_on_logout(sender, user=None, **kwargs):
+    token = getattr(user, 'token', None)
+    if token is not None:
+        invalidate_token(token.id)
+
+
 def get_default_domain(request, get_name=True):
     """Gets the default domain object to use when creating Identity object.
 
@@ -270,11 +344,7 @@ def get_default_domain(request, get_name=True):
         domain_id = request.user.user_domain_id
         domain_name = request.user.user_domain_name
         if get_name and not request.user.is_federated:
-            try:
-                domain = domain_get(request, domain_id)
-                domain_name = domain.name
-            except Exception:
-                LOG.warning("Unable to retrieve Domain: %s" % domain_id)
+            domain_name = _get_domain_name(request, domain_id, domain_name)
     domain = base.APIDictWrapper({"id": domain_id,
                                   "name": domain_name})
     return domain
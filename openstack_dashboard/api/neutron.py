@@ -641,8 +641,8 @@ def network_list_for_tenant(request, tenant_id, include_external=False,
     The list contains networks owned by the tenant and public networks.
     If requested_networks specified, it searches requested_networks only.
     """
-    LOG.debug("network_list_for_tenant(): tenant_id=%s, params=%s"
-              % (tenant_id, params))
+    LOG.debug("network_list_for_tenant(): tenant_id=%s, params=%s",
+              tenant_id, params)
 
     networks = []
     shared = params.get('shared')
@@ -677,7 +677,7 @@ def network_list_for_tenant(request, tenant_id, include_external=False,
 
 
 def network_get(request, network_id, expand_subnet=True, **params):
-    LOG.debug("network_get(): netid=%s, params=%s" % (network_id, params))
+    LOG.debug("network_get(): netid=%s, params=%s", network_id, params)
     network = neutronclient(request).show_network(network_id,
                                                   **params).get('network')
     if expand_subnet:
@@ -698,7 +698,7 @@ def network_create(request, **kwargs):
     :param name: (optional) name of the network created
     :returns: Network object
     """
-    LOG.debug("network_create(): kwargs = %s" % kwargs)
+    LOG.debug("network_create(): kwargs = %s", kwargs)
     # In the case network profiles are being used, profile id is needed.
     if 'net_profile_id' in kwargs:
         kwargs['n1kv:profile'] = kwargs.pop('net_profile_id')
@@ -710,7 +710,7 @@ def network_create(request, **kwargs):
 
 
 def network_update(request, network_id, **kwargs):
-    LOG.debug("network_update(): netid=%s, params=%s" % (network_id, kwargs))
+    LOG.debug("network_update(): netid=%s, params=%s", network_id, kwargs)
     body = {'network': kwargs}
     network = neutronclient(request).update_network(network_id,
                                                     body=body).get('network')
@@ -718,18 +718,18 @@ def network_update(request, network_id, **kwargs):
 
 
 def network_delete(request, network_id):
-    LOG.debug("network_delete(): netid=%s" % network_id)
+    LOG.debug("network_delete(): netid=%s", network_id)
     neutronclient(request).delete_network(network_id)
 
 
 def subnet_list(request, **params):
-    LOG.debug("subnet_list(): params=%s" % (params))
+    LOG.debug("subnet_list(): params=%s", params)
     subnets = neutronclient(request).list_subnets(**params).get('subnets')
     return [Subnet(s) for s in subnets]
 
 
 def subnet_get(request, subnet_id, **params):
-    LOG.debug("subnet_get(): subnetid=%s, params=%s" % (subnet_id, params))
+    LOG.debug("subnet_get(): subnetid=%s, params=%s", subnet_id, params)
     subnet = neutronclient(request).show_subnet(subnet_id,
                                                 **params).get('subnet')
     return Subnet(subnet)
@@ -753,8 +753,7 @@ def subnet_create(request, network_id, **kwargs):
     optional you MUST pass along one of the combinations to get a successful
     result.
     """
-    LOG.debug("subnet_create(): netid=%s, kwargs=%s"
-              % (network_id, kwargs))
+    LOG.debug("subnet_create(): netid=%s, kwargs=%s", network_id, kwargs)
     body = {'subnet': {'network_id': network_id}}
     if 'tenant_id' not in kwargs:
         kwargs['tenant_id'] = request.user.project_id
@@ -764,7 +763,7 @@ def subnet_create(request, network_id, **kwargs):
 
 
 def subnet_update(request, subnet_id, **kwargs):
-    LOG.debug("subnet_update(): subnetid=%s, kwargs=%s" % (subnet_id, kwargs))
+    LOG.debug("subnet_update(): subnetid=%s, kwargs=%s", subnet_id, kwargs)
     body = {'subnet': kwargs}
     subnet = neutronclient(request).update_subnet(subnet_id,
                                                   body=body).get('subnet')
@@ -772,20 +771,20 @@ def subnet_update(request, subnet_id, **kwargs):
 
 
 def subnet_delete(request, subnet_id):
-    LOG.debug("subnet_delete(): subnetid=%s" % subnet_id)
+    LOG.debug("subnet_delete(): subnetid=%s", subnet_id)
     neutronclient(request).delete_subnet(subnet_id)
 
 
 def subnetpool_list(request, **params):
-    LOG.debug("subnetpool_list(): params=%s" % (params))
+    LOG.debug("subnetpool_list(): params=%s", params)
     subnetpools = \
         neutronclient(request).list_subnetpools(**params).get('subnetpools')
     return [SubnetPool(s) for s in subnetpools]
 
 
 def subnetpool_get(request, subnetpool_id, **params):
-    LOG.debug("subnetpool_get(): subnetpoolid=%s, params=%s" %
-              (subnetpool_id, params))
+    LOG.debug("subnetpool_get(): subnetpoolid=%s, params=%s",
+              subnetpool_id, params)
     subnetpool = \
         neutronclient(request).show_subnetpool(subnetpool_id,
                                                **params).get('subnetpool')
@@ -813,8 +812,8 @@ def subnetpool_create(request, name, prefixes, **kwargs):
     Returns:
     SubnetPool object
     """
-    LOG.debug("subnetpool_create(): name=%s, prefixes=%s, kwargs=%s"
-              % (name, prefixes, kwargs))
+    LOG.debug("subnetpool_create(): name=%s, prefixes=%s, kwargs=%s",
+              name, prefixes, kwargs)
     body = {'subnetpool':
             {'name': name,
              'prefixes': prefixes,
@@ -829,8 +828,8 @@ def subnetpool_create(request, name, prefixes, **kwargs):
 
 
 def subnetpool_update(request, subnetpool_id, **kwargs):
-    LOG.debug("subnetpool_update(): subnetpoolid=%s, kwargs=%s" %
-              (subnetpool_id, kwargs))
+    LOG.debug("subnetpool_update(): subnetpoolid=%s, kwargs=%s",
+              subnetpool_id, kwargs)
     body = {'subnetpool': kwargs}
     subnetpool = \
         neutronclient(request).update_subnetpool(subnetpool_id,
@@ -839,18 +838,18 @@ def subnetpool_update(request, subnetpool_id, **kwargs):
 
 
 def subnetpool_delete(request, subnetpool_id):
-    LOG.debug("subnetpool_delete(): subnetpoolid=%s" % subnetpool_id)
+    LOG.debug("subnetpool_delete(): subnetpoolid=%s", subnetpool_id)
     return neutronclient(request).delete_subnetpool(subnetpool_id)
 
 
 def port_list(request, **params):
-    LOG.debug("port_list(): params=%s" % (params))
+    LOG.debug("port_list(): params=%s", params)
     ports = neutronclient(request).list_ports(**params).get('ports')
     return [Port(p) for p in ports]
 
 
 def port_get(request, port_id, **params):
-    LOG.debug("port_get(): portid=%s, params=%s" % (port_id, params))
+    LOG.debug("port_get(): portid=%s, params=%s", port_id, params)
     port = neutronclient(request).show_port(port_id, **params).get('port')
     return Port(port)
 
@@ -872,7 +871,7 @@ def port_create(request, network_id, **kwargs):
     :param name: (optional) name of the port created
     :returns: Port object
     """
-    LOG.debug("port_create(): netid=%s, kwargs=%s" % (network_id, kwargs))
+    LOG.debug("port_create(): netid=%s, kwargs=%s", network_id, kwargs)
     # In the case policy profiles are being used, profile id is needed.
     if 'policy_profile_id' in kwargs:
         kwargs['n1kv:profile'] = kwargs.pop('policy_profile_id')
@@ -886,12 +885,12 @@ def port_create(request, network_id, **kwargs):
 
 
 def port_delete(request, port_id):
-    LOG.debug("port_delete(): portid=%s" % port_id)
+    LOG.debug("port_delete(): portid=%s", port_id)
     neutronclient(request).delete_port(port_id)
 
 
 def port_update(request, port_id, **kwargs):
-    LOG.debug("port_update(): portid=%s, kwargs=%s" % (port_id, kwargs))
+    LOG.debug("port_update(): portid=%s, kwargs=%s", port_id, kwargs)
     kwargs = unescape_port_kwargs(**kwargs)
     body = {'port': kwargs}
     port = neutronclient(request).update_port(port_id, body=body).get('port')
@@ -958,7 +957,7 @@ def profile_bindings_list(request, type_p, **params):
 
 
 def router_create(request, **kwargs):
-    LOG.debug("router_create():, kwargs=%s" % kwargs)
+    LOG.debug("router_create():, kwargs=%s", kwargs)
     body = {'router': {}}
     if 'tenant_id' not in kwargs:
         kwargs['tenant_id'] = request.user.project_id
@@ -968,7 +967,7 @@ def router_create(request, **kwargs):
 
 
 def router_update(request, r_id, **kwargs):
-    LOG.debug("router_update(): router_id=%s, kwargs=%s" % (r_id, kwargs))
+    LOG.debug("router_update(): router_id=%s, kwargs=%s", r_id, kwargs)
     body = {'router': {}}
     body['router'].update(kwargs)
     router = neutronclient(request).update_router(r_id, body=body)
@@ -1031,7 +1030,7 @@ def router_static_route_list(request, router_id=None):
         routes = [RouterStaticRoute(r) for r in router.routes]
     except AttributeError:
         LOG.debug("router_static_route_list(): router_id=%s, "
-                  "router=%s", (router_id, router))
+                  "router=%s", router_id, router)
         return []
     return routes
 
@@ -113,9 +113,6 @@ class Server(base.APIResourceWrapper):
     # TODO(gabriel): deprecate making a call to Glance as a fallback.
     @property
     def image_name(self):
-        import glanceclient.exc as glance_exceptions  # noqa
-        from openstack_dashboard.api import glance  # noqa
-
         if not self.image:
             return _("-")
         if hasattr(self.image, 'name'):
@@ -123,6 +120,11 @@ class Server(base.APIResourceWrapper):
         if 'name' in self.image:
             return self.image['name']
         else:
+            # Only imported on the fallback path, since this property is
+            # read for every row of the instance tables.
+            import glanceclient.exc as glance_exceptions  # noqa
+            from openstack_dashboard.api import glance  # noqa
+
             try:
                 image = glance.image_get(self.request, self.image['id'])
                 return image.name
@@ -429,15 +431,14 @@ class FloatingIpManager(network_base.FloatingIpManager):
         self.client.floating_ips.delete(floating_ip_id)
 
     def associate(self, floating_ip_id, port_id):
-        # In Nova implied port_id is instance_id
-        server = self.client.servers.get(port_id)
+        # In Nova implied port_id is instance_id. The server actions only
+        # need its id, so there is no need to fetch the server first.
         fip = self.client.floating_ips.get(floating_ip_id)
-        self.client.servers.add_floating_ip(server.id, fip.ip)
+        self.client.servers.add_floating_ip(port_id, fip.ip)
 
     def disassociate(self, floating_ip_id):
         fip = self.client.floating_ips.get(floating_ip_id)
-        server = self.client.servers.get(fip.instance_id)
-        self.client.servers.remove_floating_ip(server.id, fip.ip)
+        self.client.servers.remove_floating_ip(fip.instance_id, fip.ip)
 
     def list_targets(self):
         return [FloatingIpTarget(s) for s in self.client.servers.list()]
@@ -885,7 +886,8 @@ def hypervisor_search(request, query, servers=True):
 
 def evacuate_host(request, host, target=None, on_shared_storage=False):
     # TODO(jmolle) This should be change for nova atomic api host_evacuate
-    hypervisors = novaclient(request).hypervisors.search(host, True)
+    c = novaclient(request)
+    hypervisors = c.hypervisors.search(host, True)
     response = []
     err_code = None
     for hypervisor in hypervisors:
@@ -893,9 +895,7 @@ def evacuate_host(request, host, target=None, on_shared_storage=False):
         # if hypervisor doesn't have servers, the attribute is not present
         for server in hyper.servers:
             try:
-                novaclient(request).servers.evacuate(server['uuid'],
-                                                     target,
-                                                     on_shared_storage)
+                c.servers.evacuate(server['uuid'], target, on_shared_storage)
             except nova_exceptions.ClientException as err:
                 err_code = err.code
                 msg = _("Name: %(name)s ID: %(uuid)s")
@@ -911,7 +911,8 @@ def evacuate_host(request, host, target=None, on_shared_storage=False):
 
 def migrate_host(request, host, live_migrate=False, disk_over_commit=False,
                  block_migration=False):
-    hypervisors = novaclient(request).hypervisors.search(host, True)
+    c = novaclient(request)
+    hypervisors = c.hypervisors.search(host, True)
     response = []
     err_code = None
     for hyper in hypervisors:
@@ -922,16 +923,16 @@ def migrate_host(request, host, live_migrate=False, disk_over_commit=False,
 
                     # Checking that instance can be live-migrated
                     if instance.status in ["ACTIVE", "PAUSED"]:
-                        novaclient(request).servers.live_migrate(
+                        c.servers.live_migrate(
                             server['uuid'],
                             None,
                             block_migration,
                             disk_over_commit
                         )
                     else:
-                        novaclient(request).servers.migrate(server['uuid'])
+                        c.servers.migrate(server['uuid'])
                 else:
-                    novaclient(request).servers.migrate(server['uuid'])
+                    c.servers.migrate(server['uuid'])
             except nova_exceptions.ClientException as err:
                 err_code = err.code
                 msg = _("Name: %(name)s ID: %(uuid)s")
@@ -988,11 +989,9 @@ def service_disable(request, host, binary, reason=None):
 
 
 def aggregate_details_list(request):
-    result = []
     c = novaclient(request)
-    for aggregate in c.aggregates.list():
-        result.append(c.aggregates.get_details(aggregate.id))
-    return result
+    return [c.aggregates.get_details(aggregate.id)
+            for aggregate in c.aggregates.list()]
 
 
 def aggregate_create(request, name, availability_zone=None):
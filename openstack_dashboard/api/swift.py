@@ -24,6 +24,7 @@ from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
+from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
 
@@ -33,6 +34,7 @@ CHUNK_SIZE = getattr(settings, 'SWIFT_FILE_TRANSFER_CHUNK_SIZE', 512 * 1024)
 # Swift ACL
 GLOBAL_READ_ACL = ".r:*"
 LIST_CONTENTS_ACL = ".rlistings"
+PUBLIC_CONTAINER_ACL = ",".join([GLOBAL_READ_ACL, LIST_CONTENTS_ACL])
 
 
 class Container(base.APIDictWrapper):
@@ -91,17 +93,19 @@ def _objectify(items, container_name):
 
 def _metadata_to_header(metadata):
     headers = {}
+    if metadata is None:
+        return headers
     public = metadata.get('is_public')
 
     if public is True:
-        public_container_acls = [GLOBAL_READ_ACL, LIST_CONTENTS_ACL]
-        headers['x-container-read'] = ",".join(public_container_acls)
+        headers['x-container-read'] = PUBLIC_CONTAINER_ACL
     elif public is False:
         headers['x-container-read'] = ""
 
     return headers
 
 
+@memoized
 def swift_api(request):
     endpoint = base.url_for(request, 'object-store')
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
@@ -177,7 +181,7 @@ def swift_get_container(request, container_name, with_data=True):
     return Container(container_info)
 
 
-def swift_create_container(request, name, metadata=({})):
+def swift_create_container(request, name, metadata=None):
     if swift_container_exists(request, name):
         raise exceptions.AlreadyExists(name, 'container')
     headers = _metadata_to_header(metadata)
@@ -185,7 +189,7 @@ def swift_create_container(request, name, metadata=({})):
     return Container({'name': name})
 
 
-def swift_update_container(request, name, metadata=({})):
+def swift_update_container(request, name, metadata=None):
     headers = _metadata_to_header(metadata)
     swift_api(request).post_container(name, headers=headers)
     return Container({'name': name})
@@ -63,12 +63,13 @@ class GlobalOverview(usage.UsageView):
             projects = []
             exceptions.handle(self.request,
                               _('Unable to retrieve project list.'))
+        project_dict = {t.id: t for t in projects}
         for instance in data:
-            project = [t for t in projects if t.id == instance.tenant_id]
+            project = project_dict.get(instance.tenant_id)
             # If we could not get the project name, show the tenant_id with
             # a 'Deleted' identifier instead.
             if project:
-                instance.project_name = getattr(project[0], "name", None)
+                instance.project_name = getattr(project, "name", None)
             else:
                 deleted = _("Deleted")
                 instance.project_name = translation.string_concat(
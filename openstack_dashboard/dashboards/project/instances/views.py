@@ -40,6 +40,7 @@ from horizon import workflows
 
 from openstack_dashboard import api
 from openstack_dashboard.utils import filters
+from openstack_dashboard.utils import futurist_utils
 
 from openstack_dashboard.dashboards.project.instances \
     import console as project_console
@@ -63,6 +64,22 @@ class IndexView(tables.DataTableView):
     def has_more_data(self, table):
         return self._more
 
+    def _get_flavors(self):
+        try:
+            return api.nova.flavor_list(self.request)
+        except Exception:
+            exceptions.handle(self.request, ignore=True)
+            return []
+
+    def _get_images(self):
+        try:
+            # TODO(gabriel): Handle pagination.
+            images, more, prev = api.glance.image_list_detailed(self.request)
+            return images
+        except Exception:
+            exceptions.handle(self.request, ignore=True)
+            return []
+
     def get_data(self):
         marker = self.request.GET.get(
             project_tables.InstancesTable._meta.pagination_param, None)
@@ -87,20 +104,10 @@ class IndexView(tables.DataTableView):
                     message=_('Unable to retrieve IP addresses from Neutron.'),
                     ignore=True)
 
-            # Gather our flavors and images and correlate our instances to them
-            try:
-                flavors = api.nova.flavor_list(self.request)
-            except Exception:
-                flavors = []
-                exceptions.handle(self.request, ignore=True)
-
-            try:
-                # TODO(gabriel): Handle pagination.
-                images, more, prev = api.glance.image_list_detailed(
-                    self.request)
-            except Exception:
-                images = []
-                exceptions.handle(self.request, ignore=True)
+            # Gather our flavors and images and correlate our instances to
+            # them. The two lookups are independent, so run them in parallel.
+            flavors, images = futurist_utils.call_functions_parallel(
+                self._get_flavors, self._get_images)
 
             full_flavors = OrderedDict([(str(flavor.id), flavor)
                                        for flavor in flavors])
@@ -17,41 +17,14 @@ from horizon import exceptions
 from horizon import forms
 from horizon import workflows
 
-from openstack_dashboard import api
 from openstack_dashboard.api import cinder
+from openstack_dashboard.dashboards.project.volumes.volumes \
+    import forms as volume_forms
 
 INDEX_URL = "horizon:project:volumes:index"
 CGROUP_VOLUME_MEMBER_SLUG = "update_members"
 
 
-def cinder_az_supported(request):
-    try:
-        return cinder.extension_supported(request, 'AvailabilityZones')
-    except Exception:
-        exceptions.handle(request, _('Unable to determine if availability '
-                                     'zones extension is supported.'))
-        return False
-
-
-def availability_zones(request):
-    zone_list = []
-    if cinder_az_supported(request):
-        try:
-            zones = api.cinder.availability_zone_list(request)
-            zone_list = [(zone.zoneName, zone.zoneName)
-                         for zone in zones if zone.zoneState['available']]
-            zone_list.sort()
-        except Exception:
-            exceptions.handle(request, _('Unable to retrieve availability '
-                                         'zones.'))
-    if not zone_list:
-        zone_list.insert(0, ("", _("No availability zones found")))
-    elif len(zone_list) > 1:
-        zone_list.insert(0, ("", _("Any Availability Zone")))
-
-    return zone_list
-
-
 class AddCGroupInfoAction(workflows.Action):
     name = forms.CharField(label=_("Name"),
                            max_length=255)
@@ -73,7 +46,7 @@ class AddCGroupInfoAction(workflows.Action):
                                                   *args,
                                                   **kwargs)
         self.fields['availability_zone'].choices = \
-            availability_zones(request)
+            volume_forms.availability_zones(request)
 
     class Meta(object):
         name = _("Consistency Group Information")
@@ -371,11 +344,7 @@ class UpdateCGroupWorkflow(workflows.Workflow):
 
             # scan all volumes and make correct consistency group is set
             for volume in volumes:
-                selected = False
-                for selection in selected_volumes:
-                    if selection == volume.id:
-                        selected = True
-                        break
+                selected = volume.id in selected_volumes
 
                 if selected:
                     # ensure this volume is in this consistency group
@@ -19,6 +19,7 @@
 from __future__ import absolute_import
 
 from django.conf import settings
+import mock
 
 from horizon import exceptions
 
@@ -84,6 +85,11 @@ class APIResourceWrapperTests(test.TestCase):
         self.assertIn('bar', resource_str)
         self.assertNotIn('baz', resource_str)
 
+    def test_attrs_keep_declared_order(self):
+        self.assertEqual(['foo', 'bar', 'baz'], APIResource._attrs)
+        self.assertEqual(frozenset(['foo', 'bar', 'baz']),
+                         APIResource._attrs_set)
+
 
 class APIDictWrapperTests(test.TestCase):
     # APIDict allows for both attribute access and dictionary style [element]
@@ -240,6 +246,25 @@ class ApiHelperTests(test.TestCase):
         with self.assertRaises(exceptions.ServiceCatalogException):
             url = api_base.url_for(self.request, 'image')
 
+    def test_url_for_is_cached_per_request(self):
+        with mock.patch.object(api_base, 'get_service_from_catalog',
+                               wraps=api_base.get_service_from_catalog) \
+                as get_service:
+            url = api_base.url_for(self.request, 'compute')
+            self.assertEqual('http://public.nova.example.com:8774/v2', url)
+            url = api_base.url_for(self.request, 'compute')
+            self.assertEqual('http://public.nova.example.com:8774/v2', url)
+            self.assertEqual(1, get_service.call_count)
+
+            url = api_base.url_for(self.request, 'compute',
+                                   endpoint_type='adminURL')
+            self.assertEqual('http://admin.nova.example.com:8774/v2', url)
+            self.assertEqual(2, get_service.call_count)
+
+            self.request._url_for_cache.clear()
+            api_base.url_for(self.request, 'compute')
+            self.assertEqual(3, get_service.call_count)
+
 
 class QuotaSetTests(test.TestCase):
 
@@ -16,6 +16,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import json
+
 from django.conf import settings
 from django.test.utils import override_settings
 
@@ -261,6 +264,24 @@ class GlanceApiTests(test.APITestCase):
         image = api.glance.image_get(self.request, 'empty')
         self.assertIsNone(image.name)
 
+    def test_image_v2_properties(self):
+        image = self.imagesV2.list()[-1]
+        properties = image.properties
+        self.assertEqual(u'foo val', properties['foo'])
+        self.assertNotIn('name', properties)
+        self.assertNotIn('tags', properties)
+        # The computed properties are stored on the instance.
+        self.assertIs(properties, image.__dict__['properties'])
+        self.assertIs(properties, image.properties)
+
+    def test_metadefs_namespace_as_json_keeps_attrs_order(self):
+        namespace = api.glance.Namespace(self.metadata_defs.first())
+        contents = json.loads(namespace.as_json(),
+                              object_pairs_hook=collections.OrderedDict)
+        expected = [attr for attr in api.glance.Namespace._attrs
+                    if attr in contents]
+        self.assertEqual(expected, list(contents))
+
     def test_metadefs_namespace_list(self):
         metadata_defs = self.metadata_defs.list()
         limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
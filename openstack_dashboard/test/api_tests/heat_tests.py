@@ -9,16 +9,27 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
-import six
+import base64
 
 from django.conf import settings
 from django.test.utils import override_settings  # noqa
+import requests
+from requests import cookies
+
+from heatclient import exc as heat_exceptions
 
 from horizon import exceptions
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
 
+def _fake_response(content, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
 class HeatApiTests(test.APITestCase):
     def test_stack_list(self):
         api_stacks = self.stacks.list()
@@ -275,9 +286,10 @@ class HeatApiTests(test.APITestCase):
         expected_files = {u'http://test.example/example': b'echo "test"'}
         url = 'http://test.example/example'
         data = b'echo "test"'
-        self.mox.StubOutWithMock(six.moves.urllib.request, 'urlopen')
-        six.moves.urllib.request.urlopen(url).AndReturn(
-            six.BytesIO(data))
+        timeout = api.heat.TEMPLATE_FETCH_TIMEOUT
+        self.mox.StubOutWithMock(api.heat.TEMPLATE_SESSION, 'get')
+        api.heat.TEMPLATE_SESSION.get(url, timeout=timeout) \
+            .AndReturn(_fake_response(data))
         self.mox.ReplayAll()
         files = api.heat.get_template_files(template_data=tmpl)[0]
         self.assertEqual(files, expected_files)
@@ -301,15 +313,62 @@ class HeatApiTests(test.APITestCase):
         url2 = 'http://test.example/example'
         data2 = b'echo "test"'
         expected_files = {'http://test.example/example': b'echo "test"'}
-        self.mox.StubOutWithMock(six.moves.urllib.request, 'urlopen')
-        six.moves.urllib.request.urlopen(url).AndReturn(
-            six.BytesIO(data))
-        six.moves.urllib.request.urlopen(url2).AndReturn(
-            six.BytesIO(data2))
+        timeout = api.heat.TEMPLATE_FETCH_TIMEOUT
+        self.mox.StubOutWithMock(api.heat.TEMPLATE_SESSION, 'get')
+        api.heat.TEMPLATE_SESSION.get(url, timeout=timeout) \
+            .AndReturn(_fake_response(data))
+        api.heat.TEMPLATE_SESSION.get(url2, timeout=timeout) \
+            .AndReturn(_fake_response(data2))
         self.mox.ReplayAll()
         files = api.heat.get_template_files(template_url=url)[0]
         self.assertEqual(files, expected_files)
 
+    def test_get_template_files_with_unreachable_template_url(self):
+        url = 'https://test.example/example.yaml'
+        timeout = api.heat.TEMPLATE_FETCH_TIMEOUT
+        self.mox.StubOutWithMock(api.heat.TEMPLATE_SESSION, 'get')
+        api.heat.TEMPLATE_SESSION.get(url, timeout=timeout) \
+            .AndReturn(_fake_response(b'', status_code=404))
+        self.mox.ReplayAll()
+        self.assertRaises(heat_exceptions.CommandError,
+                          api.heat.get_template_files, template_url=url)
+
+    def test_get_template_files_binary_file_is_base64_encoded(self):
+        url = 'https://test.example/example.yaml'
+        data = (b'heat_template_version: 2013-05-23\n'
+                b'resources:\n'
+                b'  foo:\n'
+                b'    get_file: https://test.example/b\n')
+        binary = b'\xff\xfe\x00'
+        timeout = api.heat.TEMPLATE_FETCH_TIMEOUT
+        self.mox.StubOutWithMock(api.heat.TEMPLATE_SESSION, 'get')
+        api.heat.TEMPLATE_SESSION.get(url, timeout=timeout) \
+            .AndReturn(_fake_response(data))
+        api.heat.TEMPLATE_SESSION.get('https://test.example/b',
+                                      timeout=timeout) \
+            .AndReturn(_fake_response(binary))
+        self.mox.ReplayAll()
+        files = api.heat.get_template_files(template_url=url)[0]
+        self.assertEqual(
+            binary, base64.b64decode(files['https://test.example/b']))
+
+    def test_template_session_rejects_cookies(self):
+        class FakeHeaders(object):
+            def get_all(self, name, default=None):
+                if name == 'Set-Cookie':
+                    return ['session=secret; Path=/']
+                return default or []
+
+            def getheaders(self, name):
+                return self.get_all(name)
+
+        prepared = requests.Request(
+            'GET', 'https://test.example/example.yaml').prepare()
+        jar = api.heat.TEMPLATE_SESSION.cookies
+        jar.extract_cookies(cookies.MockResponse(FakeHeaders()),
+                            cookies.MockRequest(prepared))
+        self.assertEqual(0, len(jar))
+
     def test_get_template_files_invalid(self):
         tmpl = '''
     # comment
@@ -18,7 +18,9 @@
 
 from __future__ import absolute_import
 
+from django.contrib.auth import signals as auth_signals
 from keystoneclient.v2_0 import client as keystone_client
+import mock
 import six
 
 from openstack_dashboard import api
@@ -84,6 +86,106 @@ class RoleAPITests(test.APITestCase):
         role = api.keystone.get_default_role(self.request)
 
 
+class DomainAPITests(test.APITestCase):
+    def setUp(self):
+        super(DomainAPITests, self).setUp()
+        self.request.user.user_domain_id = self.domain.id
+
+    def test_get_default_domain_caches_name(self):
+        domain = self.domain
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.domains = self.mox.CreateMockAnything()
+        keystoneclient.domains.get(domain.id).AndReturn(domain)
+        self.mox.ReplayAll()
+        default_domain = api.keystone.get_default_domain(self.request)
+        self.assertEqual(domain.name, default_domain.name)
+        # Verify that a second call doesn't hit the API again,
+        # (it would show up in mox as an unexpected method call)
+        default_domain = api.keystone.get_default_domain(self.request)
+        self.assertEqual(domain.name, default_domain.name)
+
+    def test_invalidate_token(self):
+        domain = self.domain
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.domains = self.mox.CreateMockAnything()
+        keystoneclient.domains.get(domain.id).AndReturn(domain)
+        keystoneclient.domains.get(domain.id).AndReturn(domain)
+        self.mox.ReplayAll()
+        api.keystone.get_default_domain(self.request)
+        api.keystone.invalidate_token(self.request.user.token.id)
+        # The name is looked up again once the token was invalidated.
+        api.keystone.get_default_domain(self.request)
+
+    def test_domain_update_invalidates_cached_name(self):
+        domain = self.domain
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.domains = self.mox.CreateMockAnything()
+        keystoneclient.domains.get(domain.id).AndReturn(domain)
+        keystoneclient.domains.update(domain.id, name='new_name',
+                                      description=None,
+                                      enabled=None).AndReturn(domain)
+        keystoneclient.domains.get(domain.id).AndReturn(domain)
+        self.mox.ReplayAll()
+        api.keystone.get_default_domain(self.request)
+        api.keystone.domain_update(self.request, domain.id, name='new_name')
+        # The renamed domain is looked up again.
+        api.keystone.get_default_domain(self.request)
+
+    def test_domain_delete_invalidates_cached_name(self):
+        domain = self.domain
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.domains = self.mox.CreateMockAnything()
+        keystoneclient.domains.get(domain.id).AndReturn(domain)
+        keystoneclient.domains.delete(domain.id)
+        keystoneclient.domains.get(domain.id).AndReturn(domain)
+        self.mox.ReplayAll()
+        api.keystone.get_default_domain(self.request)
+        api.keystone.domain_delete(self.request, domain.id)
+        api.keystone.get_default_domain(self.request)
+
+    def test_get_default_domain_caches_fallback_name(self):
+        domain = self.domain
+        self.request.user.user_domain_name = 'token_domain_name'
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.domains = self.mox.CreateMockAnything()
+        keystoneclient.domains.get(domain.id) \
+            .AndRaise(self.exceptions.keystone)
+        self.mox.ReplayAll()
+        default_domain = api.keystone.get_default_domain(self.request)
+        self.assertEqual('token_domain_name', default_domain.name)
+        # The failed lookup isn't retried until the cached name expires.
+        default_domain = api.keystone.get_default_domain(self.request)
+        self.assertEqual('token_domain_name', default_domain.name)
+
+    def test_cached_name_expires(self):
+        domain = self.domain
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.domains = self.mox.CreateMockAnything()
+        keystoneclient.domains.get(domain.id).AndReturn(domain)
+        keystoneclient.domains.get(domain.id).AndReturn(domain)
+        self.mox.ReplayAll()
+        now = 1000000.0
+        with mock.patch.object(api.keystone.time, 'time', return_value=now):
+            api.keystone.get_default_domain(self.request)
+        expired = now + api.keystone.TOKEN_CACHE_TTL
+        with mock.patch.object(api.keystone.time, 'time',
+                               return_value=expired):
+            api.keystone.get_default_domain(self.request)
+
+    def test_logout_invalidates_cached_name(self):
+        domain = self.domain
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.domains = self.mox.CreateMockAnything()
+        keystoneclient.domains.get(domain.id).AndReturn(domain)
+        keystoneclient.domains.get(domain.id).AndReturn(domain)
+        self.mox.ReplayAll()
+        api.keystone.get_default_domain(self.request)
+        auth_signals.user_logged_out.send(sender=self.__class__,
+                                          request=self.request,
+                                          user=self.request.user)
+        api.keystone.get_default_domain(self.request)
+
+
 class ServiceAPITests(test.APITestCase):
     def test_service_wrapper(self):
         catalog = self.service_catalog
@@ -183,7 +183,6 @@ class NetworkApiNovaFloatingIpTests(NetworkApiNovaTestBase):
         novaclient = self.stub_novaclient()
         novaclient.floating_ips = self.mox.CreateMockAnything()
         novaclient.servers = self.mox.CreateMockAnything()
-        novaclient.servers.get(server.id).AndReturn(server)
         novaclient.floating_ips.get(floating_ip.id).AndReturn(floating_ip)
         novaclient.servers.add_floating_ip(server.id, floating_ip.ip) \
                           .AndReturn(server)
@@ -200,7 +199,6 @@ class NetworkApiNovaFloatingIpTests(NetworkApiNovaTestBase):
         novaclient = self.stub_novaclient()
         novaclient.servers = self.mox.CreateMockAnything()
         novaclient.floating_ips = self.mox.CreateMockAnything()
-        novaclient.servers.get(server.id).AndReturn(server)
         novaclient.floating_ips.get(floating_ip.id).AndReturn(floating_ip)
         novaclient.servers.remove_floating_ip(server.id, floating_ip.ip) \
                           .AndReturn(server)
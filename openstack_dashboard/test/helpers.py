@@ -175,6 +175,10 @@ class TestCase(horizon_helpers.TestCase):
         self.patchers = {}
         self.add_panel_mocks()
 
+        # Keystone lookups are cached per token across requests, and the
+        # test data uses the same token everywhere.
+        api.keystone.invalidate_token()
+
         super(TestCase, self).setUp()
 
     def _setup_test_data(self):
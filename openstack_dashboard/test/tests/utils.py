@@ -18,6 +18,7 @@ import uuid
 
 from openstack_dashboard.test import helpers as test
 from openstack_dashboard.utils import filters
+from openstack_dashboard.utils import futurist_utils
 from openstack_dashboard.utils import metering
 
 
@@ -42,6 +43,30 @@ class UtilsFilterTests(test.TestCase):
         self.assertRaises(ValueError, filters.get_int_or_uuid, val)
 
 
+class UtilsFuturistTests(test.TestCase):
+    def test_call_functions_parallel(self):
+        def func1():
+            return 10
+
+        def func2(value, increment=1):
+            return value + increment
+
+        ret = futurist_utils.call_functions_parallel(
+            func1, (func2, [1]), (func2, [1], {'increment': 5}))
+        self.assertEqual((10, 2, 6), ret)
+
+    def test_call_functions_parallel_without_functions(self):
+        self.assertEqual((), futurist_utils.call_functions_parallel())
+
+    def test_call_functions_parallel_raises(self):
+        def func():
+            raise ValueError('fake')
+
+        self.assertRaises(ValueError,
+                          futurist_utils.call_functions_parallel,
+                          func, lambda: 1)
+
+
 class UtilsMeteringTests(test.TestCase):
 
     def test_calc_date_args_strings(self):
@@ -0,0 +1,45 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import futurist
+
+
+def call_functions_parallel(*calls):
+    """Calls independent functions concurrently and returns their results.
+
+    This is meant for views which need the results of several unrelated
+    API calls, so that the page waits for the slowest call instead of the
+    sum of all of them.
+
+    Each positional argument is either a callable or a tuple of
+    ``(callable, args)`` or ``(callable, args, kwargs)``, for example::
+
+        flavors, images = call_functions_parallel(
+            (api.nova.flavor_list, [request]),
+            (api.glance.image_list_detailed, [request], {'paginate': True}))
+
+    The results are returned as a tuple in the order the calls were given.
+    If any of the calls raises, the exception is re-raised once all of them
+    have finished.
+    """
+    if not calls:
+        return ()
+
+    futures = []
+    with futurist.ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        for call in calls:
+            if callable(call):
+                call = (call,)
+            args = call[1] if len(call) > 1 else ()
+            kwargs = call[2] if len(call) > 2 else {}
+            futures.append(executor.submit(call[0], *args, **kwargs))
+    return tuple(future.result() for future in futures)